@@ -1,7 +1,11 @@
-import random
+import heapq
+import multiprocessing
 import time
+from operator import attrgetter
+import numpy as np
 class Student:
     """Represents a student record with name, roll number, and CGPA."""
+    __slots__ = ('name', 'roll_no', 'cgpa')
     def __init__(self, name, roll_no, cgpa):
         self.name = name
         self.roll_no = roll_no
@@ -9,25 +13,27 @@ class Student:
     def __repr__(self):
         return f"Student(Name='{self.name}', RollNo='{self.roll_no}', CGPA={self.cgpa})"
 def generate_large_dataset(size):
-    """Generates a large list of student records."""
-    dataset = []
-    for i in range(size):
-        name = f"Student_{i}"
-        roll_no = f"R{i}"
-        cgpa = round(random.uniform(7.0, 10.0), 2)
-        dataset.append(Student(name, roll_no, cgpa))
-    return dataset
+    """Generates a large set of student records as parallel arrays: CGPA (float32), names and roll numbers."""
+    rng = np.random.default_rng()
+    cgpa = np.round(rng.uniform(7.0, 10.0, size), 2).astype(np.float32)
+    names = np.array([f"Student_{i}" for i in range(size)], dtype=object)
+    rolls = np.array([f"R{i}" for i in range(size)], dtype=object)
+    return cgpa, names, rolls
+def build_students(cgpa, names, rolls):
+    """Creates Student objects from the parallel arrays."""
+    return [Student(name, roll_no, round(c, 2)) for c, name, roll_no in zip(cgpa.tolist(), names, rolls)]
 # --- Quick Sort Implementation ---
-def quick_sort(students):
-    """Sorts a list of students by CGPA in descending order using Quick Sort."""
-    if len(students) <= 1:
-        return students
-    else:
-        pivot = students[len(students) // 2]
-        less = [s for s in students if s.cgpa > pivot.cgpa]
-        equal = [s for s in students if s.cgpa == pivot.cgpa]
-        greater = [s for s in students if s.cgpa < pivot.cgpa]
-        return quick_sort(less) + equal + quick_sort(greater)
+def quick_sort_soa(cgpa, names, rolls):
+    """Sorts the student arrays by CGPA in descending order using NumPy's introsort."""
+    idx = np.argsort(-cgpa, kind='quicksort')
+    return cgpa[idx], names[idx], rolls[idx]
+# --- Timsort Implementation ---
+def sort_students(students):
+    """
+    Sorts a list of students by CGPA in descending order.
+    Uses the built-in Timsort with a C-level key instead of a hand-written Quick Sort.
+    """
+    return sorted(students, key=attrgetter('cgpa'), reverse=True)
 # --- Merge Sort Implementation ---
 def merge(left, right):
     """Merges two sorted lists of students."""
@@ -53,33 +59,84 @@ def merge_sort(students):
     left_half = merge_sort(left_half)
     right_half = merge_sort(right_half)
     return merge(left_half, right_half)
+def sort_chunk(chunk):
+    """
+    Sorts one chunk of CGPAs in descending order (runs in a worker process).
+    'chunk' is (start, cgpas); returns the global indices of the chunk in sorted order.
+    """
+    start, cgpas = chunk
+    order = sorted(range(len(cgpas)), key=cgpas.__getitem__, reverse=True)
+    return [start + i for i in order]
+def parallel_merge_sort(students, workers=4):
+    """Sorts students by CGPA in descending order: chunks are sorted in parallel processes, then merged."""
+    if len(students) <= 1:
+        return list(students)
+    # Only the CGPA keys go to the workers and only indices come back, so the
+    # caller's Student objects are returned reordered rather than as pickled copies
+    cgpas = [s.cgpa for s in students]
+    chunk_size = -(-len(students) // workers)
+    chunks = [(i, cgpas[i:i + chunk_size]) for i in range(0, len(cgpas), chunk_size)]
+    # 'fork' starts workers as copies of this process, so they skip re-importing this
+    # module; the chunks and results are still pickled (not available on Windows)
+    start_method = 'fork' if 'fork' in multiprocessing.get_all_start_methods() else None
+    with multiprocessing.get_context(start_method).Pool(len(chunks)) as pool:
+        sorted_chunks = pool.map(sort_chunk, chunks)
+    merged = heapq.merge(*sorted_chunks, key=cgpas.__getitem__, reverse=True)
+    return [students[i] for i in merged]
 # --- Top 10 Students Function ---
 def get_top_10_students(students):
     """Returns the top 10 students with the highest CGPA."""
-    sorted_students = sorted(students, key=lambda s: s.cgpa, reverse=True)
-    return sorted_students[:10]
+    return heapq.nlargest(10, students, key=lambda s: s.cgpa)
+def get_top_10_soa(cgpa, names, rolls):
+    """Returns the top 10 students from the arrays, partitioning first and sorting only those 10."""
+    k = min(10, len(cgpa))
+    if k == 0:
+        return []
+    idx = np.argpartition(-cgpa, k - 1)[:k]
+    idx = idx[np.argsort(-cgpa[idx], kind='quicksort')]
+    return [Student(names[i], rolls[i], round(float(cgpa[i]), 2)) for i in idx]
 if __name__ == "__main__":
     DATASET_SIZE = 50000
     print(f"Generating a dataset of {DATASET_SIZE} student records...")
-    students_for_quick = generate_large_dataset(DATASET_SIZE)
-    students_for_merge = list(students_for_quick) # Create a copy for the other algorithm
+    cgpa_arr, name_arr, roll_arr = generate_large_dataset(DATASET_SIZE)
+    students_list = build_students(cgpa_arr, name_arr, roll_arr) # The list-based sorts work on Student objects
     # --- Performance Comparison ---
     print("\n--- Performance Comparison ---")
     # Quick Sort
     start_time_quick = time.time()
-    quick_sorted_list = quick_sort(students_for_quick)
+    quick_sorted_cgpa, quick_sorted_names, quick_sorted_rolls = quick_sort_soa(cgpa_arr, name_arr, roll_arr)
     end_time_quick = time.time()
     quick_sort_duration = end_time_quick - start_time_quick
     print(f"Quick Sort completed in: {quick_sort_duration:.4f} seconds.")
+    # Timsort on the Student list
+    start_time_timsort = time.time()
+    timsorted_list = sort_students(students_list)
+    end_time_timsort = time.time()
+    timsort_duration = end_time_timsort - start_time_timsort
+    print(f"Timsort (Student list) completed in: {timsort_duration:.4f} seconds.")
     # Merge Sort
     start_time_merge = time.time()
-    merge_sorted_list = merge_sort(students_for_merge)
+    merge_sorted_list = merge_sort(students_list)
     end_time_merge = time.time()
     merge_sort_duration = end_time_merge - start_time_merge
     print(f"Merge Sort completed in: {merge_sort_duration:.4f} seconds.")
+    # Parallel Merge Sort
+    start_time_parallel = time.time()
+    parallel_sorted_list = parallel_merge_sort(students_list)
+    end_time_parallel = time.time()
+    parallel_sort_duration = end_time_parallel - start_time_parallel
+    print(f"Parallel Merge Sort completed in: {parallel_sort_duration:.4f} seconds.")
+    # --- Top 10 Selection Comparison ---
+    start_time_top_list = time.time()
+    top_10_list = get_top_10_students(students_list)
+    end_time_top_list = time.time()
+    print(f"Top 10 via heapq.nlargest (Student list) completed in: {end_time_top_list - start_time_top_list:.4f} seconds.")
+    start_time_top_soa = time.time()
+    top_10 = get_top_10_soa(cgpa_arr, name_arr, roll_arr) # Partition the CGPA array instead of a full sort
+    end_time_top_soa = time.time()
+    print(f"Top 10 via np.argpartition (CGPA array) completed in: {end_time_top_soa - start_time_top_soa:.4f} seconds.")
     # --- Output Top 10 Students ---
     print("\n--- Top 10 Students for Placement Drive (by CGPA) ---")
-    top_10 = get_top_10_students(quick_sorted_list) # Use the sorted list from Quick Sort
     for i, student in enumerate(top_10):
         print(f"{i+1}. {student}")
 
@@ -1,8 +1,22 @@
+import bisect
 import json
+import os
 import random
+import re
 import time
+from collections import defaultdict
+import numpy as np
+import orjson
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+try:
+    import hyperscan
+except ImportError:  # Hyperscan is optional; its search is skipped without it
+    hyperscan = None
 class Paper:
     """Represents a research paper."""
+    __slots__ = ('title', 'author')
     def __init__(self, title, author):
         self.title = title
         self.author = author
@@ -22,88 +36,118 @@ def generate_dataset(size=100000):
     print(f"Generated a dataset of {size} papers and saved to papers.json.")
     return papers
 def load_data(file_path="papers.json"):
-    """Loads paper data from a JSON file."""
+    """
+    Loads paper data as an Arrow table with 'title' and 'author' columns.
+    The JSON file is parsed once and cached next to it as Parquet; later runs
+    memory-map the Parquet file instead, unless the JSON file has changed since.
+    """
+    parquet_path = os.path.splitext(file_path)[0] + ".parquet"
+    if os.path.exists(parquet_path) and (not os.path.exists(file_path)
+                                         or os.path.getmtime(parquet_path) >= os.path.getmtime(file_path)):
+        return pq.read_table(parquet_path, memory_map=True)
     try:
-        with open(file_path, "r") as f:
-            data = json.load(f)
-        return [Paper(d['title'], d['author']) for d in data]
+        with open(file_path, "rb") as f:
+            data = orjson.loads(f.read())
     except FileNotFoundError:
         print(f"File '{file_path}' not found. Generating a new dataset.")
-        return [Paper(d['title'], d['author']) for d in generate_dataset()]
+        data = generate_dataset()
+    table = pa.table({'title': [d['title'] for d in data],
+                      'author': [d['author'] for d in data]})
+    pq.write_table(table, parquet_path)
+    return table
+def get_papers(titles, authors, indices):
+    """Creates Paper objects for the given paper indices."""
+    return [Paper(titles[i], authors[i]) for i in indices]
+def build_search_columns(table):
+    """Builds lowercased Arrow string columns of titles and authors for vectorized scans."""
+    titles_lc = pc.utf8_lower(table.column('title'))
+    authors_lc = pc.utf8_lower(table.column('author'))
+    return titles_lc, authors_lc
+def lowercase_keyword(keyword):
+    """Lowercases a keyword exactly like build_search_columns() (str.lower() differs on letters such as Σ and İ)."""
+    return pc.utf8_lower(pa.scalar(keyword)).as_py()
 # --- Search Algorithms ---
-def linear_search(papers, keyword):
+# Each search returns the indices of the matching papers.
+def linear_search(titles_lc, authors_lc, keyword):
     """Performs a linear search for a keyword in titles and authors."""
-    matches = []
-    keyword_lower = keyword.lower()
-    for paper in papers:
-        if keyword_lower in paper.title.lower() or keyword_lower in paper.author.lower():
-            matches.append(paper)
-    return matches
+    keyword_lower = lowercase_keyword(keyword)
+    mask = pc.or_(pc.match_substring(titles_lc, keyword_lower),
+                  pc.match_substring(authors_lc, keyword_lower))
+    return mask.to_numpy(zero_copy_only=False).nonzero()[0].tolist()
 
-def binary_search(sorted_papers, keyword):
+def build_scan_buffer(titles_lc, authors_lc):
+    """
+    Packs the lowercased title and author columns into one NUL-separated bytes buffer for Hyperscan.
+    Also returns the byte offset at which each paper's record starts.
+    """
+    records = [f"{title}\0{author}\0".encode()
+               for title, author in zip(titles_lc.to_pylist(), authors_lc.to_pylist())]
+    offsets = np.zeros(len(records), dtype=np.int64)
+    np.cumsum([len(r) for r in records[:-1]], out=offsets[1:])
+    return b"".join(records), offsets
+
+def hyperscan_search(scan_buffer, offsets, keywords):
+    """
+    Performs a single case-insensitive Hyperscan pass for any of the keywords in titles and authors.
+    The buffer holds the same lowercased text as linear_search scans, and the keywords are
+    lowercased the same way, so both searches return the same papers.
     """
-    Performs a binary search on a sorted list of papers by title.
+    if not keywords:
+        return []
+    if not all(keywords):
+        # An empty keyword is a substring of every record, as with linear_search
+        return list(range(len(offsets)))
+    # NUL separates the fields in the buffer and never occurs inside a title or author,
+    # so a keyword containing it could only produce false hits across a separator
+    keywords = [lowercase_keyword(k) for k in keywords if "\0" not in k]
+    if not keywords:
+        return []
+    db = hyperscan.Database()
+    db.compile(expressions=[re.escape(k).encode() for k in keywords],
+               ids=list(range(len(keywords))),
+               # Case is already folded by utf8_lower, so the patterns are plain UTF-8 literals
+               flags=[hyperscan.HS_FLAG_UTF8] * len(keywords))
+    match_ends = []
+    def on_match(pattern_id, start, end, flags, context):
+        match_ends.append(end - 1)
+    db.scan(scan_buffer, match_event_handler=on_match)
+    # Map each match's last byte back to the paper whose record contains it
+    return np.unique(np.searchsorted(offsets, match_ends, side='right') - 1).tolist()
+
+def binary_search(sorted_indices, sorted_keys, keyword):
+    """
+    Performs a binary search on papers sorted by title.
+    'sorted_keys' holds the lowercased title of each paper in 'sorted_indices'.
     Note: This is a simplified version and works best for exact title matches.
     """
-    matches = []
     keyword_lower = keyword.lower()
     
-    # Find a potential match using a standard binary search
-    low, high = 0, len(sorted_papers) - 1
-    found_index = -1
-    while low <= high:
-        mid = (low + high) // 2
-        mid_title_lower = sorted_papers[mid].title.lower()
-        if mid_title_lower == keyword_lower:
-            found_index = mid
-            break
-        elif mid_title_lower < keyword_lower:
-            low = mid + 1
-        else:
-            high = mid - 1
+    # Locate the whole run of papers with the exact same title
+    low = bisect.bisect_left(sorted_keys, keyword_lower)
+    high = bisect.bisect_right(sorted_keys, keyword_lower, low)
+    return sorted_indices[low:high]
+
+def build_hash_tables(titles, authors):
+    """Builds case-insensitive hash-based data structures for quick lookups."""
+    title_map = defaultdict(list)
+    author_map = defaultdict(list)
     
-    if found_index != -1:
-        # Check for all papers with the exact same title
-        # Look backwards
-        i = found_index
-        while i >= 0 and sorted_papers[i].title.lower() == keyword_lower:
-            matches.append(sorted_papers[i])
-            i -= 1
-        # Look forwards
-        j = found_index + 1
-        while j < len(sorted_papers) and sorted_papers[j].title.lower() == keyword_lower:
-            matches.append(sorted_papers[j])
-            j += 1
-            
-    return matches
-
-def build_hash_tables(papers):
-    """Builds hash-based data structures for quick lookups."""
-    title_map = {}
-    author_map = {}
-    
-    for paper in papers:
-        if paper.title in title_map:
-            title_map[paper.title].append(paper)
-        else:
-            title_map[paper.title] = [paper]
-            
-        if paper.author in author_map:
-            author_map[paper.author].append(paper)
-        else:
-            author_map[paper.author] = [paper]
+    for i, (title, author) in enumerate(zip(titles, authors)):
+        title_map[title.lower()].append(i)
+        author_map[author.lower()].append(i)
             
     return title_map, author_map
 
 def hash_search(title_map, author_map, keyword):
-    """Performs a hash-based search for exact matches."""
+    """Performs a hash-based search for exact (case-insensitive) matches."""
     matches = []
-    if keyword in title_map:
-        matches.extend(title_map[keyword])
-    if keyword in author_map:
+    keyword_lower = keyword.lower()
+    if keyword_lower in title_map:
+        matches.extend(title_map[keyword_lower])
+    if keyword_lower in author_map:
         # Use a set to avoid adding the same paper twice if it matches both
         unique_matches = set(matches)
-        unique_matches.update(author_map[keyword])
+        unique_matches.update(author_map[keyword_lower])
         matches = list(unique_matches)
     return matches
 
@@ -111,28 +155,52 @@ def hash_search(title_map, author_map, keyword):
 
 if __name__ == "__main__":
     # Load or generate the dataset
-    papers_list = load_data()
+    papers_table = load_data()
+    # Python lists for the searches that work on str objects
+    titles = papers_table.column('title').to_pylist()
+    authors = papers_table.column('author').to_pylist()
     
     # User input for search
     search_keyword = input("Enter a keyword (e.g., a title or author name): ")
 
     # --- Performance and Results Comparison ---
-    print(f"\nSearching for '{search_keyword}' in a dataset of {len(papers_list)} papers...")
+    print(f"\nSearching for '{search_keyword}' in a dataset of {len(titles)} papers...")
 
     # Linear Search
+    # Note: The lowercased columns are built once and reused by every query.
+    start_time_columns = time.perf_counter()
+    titles_lc, authors_lc = build_search_columns(papers_table)
+    end_time_columns = time.perf_counter()
+
     start_time_linear = time.perf_counter()
-    linear_results = linear_search(papers_list, search_keyword)
+    linear_results = linear_search(titles_lc, authors_lc, search_keyword)
     end_time_linear = time.perf_counter()
     print(f"\nLinear Search: Found {len(linear_results)} matches in {end_time_linear - start_time_linear:.6f} seconds.")
+    print(f"  (Note: Initial column build took {end_time_columns - start_time_columns:.6f} seconds.)")
+
+    # Hyperscan Search
+    if hyperscan is not None:
+        start_time_buffer = time.perf_counter()
+        scan_buffer, offsets = build_scan_buffer(titles_lc, authors_lc)
+        end_time_buffer = time.perf_counter()
+
+        start_time_hyperscan = time.perf_counter()
+        hyperscan_results = hyperscan_search(scan_buffer, offsets, [search_keyword])
+        end_time_hyperscan = time.perf_counter()
+        print(f"Hyperscan Search: Found {len(hyperscan_results)} matches in {end_time_hyperscan - start_time_hyperscan:.6f} seconds.")
+        print(f"  (Note: Initial buffer build took {end_time_buffer - start_time_buffer:.6f} seconds.)")
+    else:
+        print("Hyperscan Search: skipped (hyperscan is not installed).")
 
     # Binary Search
     # Note: Binary search requires the data to be sorted first. This step is crucial.
     start_time_sort = time.perf_counter()
-    sorted_papers = sorted(papers_list, key=lambda p: p.title.lower())
+    sorted_indices = sorted(range(len(titles)), key=lambda i: titles[i].lower())
+    sorted_keys = [titles[i].lower() for i in sorted_indices]
     end_time_sort = time.perf_counter()
     
     start_time_binary = time.perf_counter()
-    binary_results = binary_search(sorted_papers, search_keyword)
+    binary_results = binary_search(sorted_indices, sorted_keys, search_keyword)
     end_time_binary = time.perf_counter()
     
     print(f"Binary Search: Found {len(binary_results)} matches in {end_time_binary - start_time_binary:.6f} seconds.")
@@ -140,7 +208,7 @@ if __name__ == "__main__":
 
     # Hash-based Search
     start_time_hash_build = time.perf_counter()
-    title_map, author_map = build_hash_tables(papers_list)
+    title_map, author_map = build_hash_tables(titles, authors)
     end_time_hash_build = time.perf_counter()
 
     start_time_hash_search = time.perf_counter()
@@ -153,7 +221,7 @@ if __name__ == "__main__":
     # Displaying Results (optional, as they can be very long)
     if linear_results:
         print("\n--- First 5 Matches ---")
-        for i, paper in enumerate(linear_results[:5]):
+        for paper in get_papers(titles, authors, linear_results[:5]):
             print(f"  {paper}")
 
 
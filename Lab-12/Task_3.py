@@ -1,47 +1,37 @@
-import math
-import random
+import numpy as np
+from numba import njit, prange
 import matplotlib.pyplot as plt
 
 # --- 1. Data Generation and Helper Functions ---
 def generate_sensor_coordinates(num_sensors):
-    """Generates random (x, y) coordinates for sensors."""
-    return [(random.uniform(0, 100), random.uniform(0, 100)) for _ in range(num_sensors)]
+    """Generates random (x, y) coordinates for sensors as an (N, 2) array."""
+    return np.random.uniform(0, 100, size=(num_sensors, 2))
 
-def euclidean_distance(p1, p2):
-    """Calculates the Euclidean distance between two points (x, y)."""
-    return math.sqrt((p1[0] - p2[0])**2 + (p1[1] - p2[1])**2)
+def distance_matrix(coordinates):
+    """Precomputes the N x N matrix of Euclidean distances between all sensors."""
+    return np.hypot(coordinates[:, None, 0] - coordinates[None, :, 0],
+                    coordinates[:, None, 1] - coordinates[None, :, 1])
 
-def calculate_total_distance(route, coordinates):
-    """Calculates the total distance of a given route."""
-    distance = 0
+def calculate_total_distance(route, distances):
+    """Calculates the total distance of a given route using the distance matrix."""
+    route = np.asarray(route)
     if len(route) < 2:
         return 0
     
-    for i in range(len(route) - 1):
-        p1 = coordinates[route[i]]
-        p2 = coordinates[route[i+1]]
-        distance += euclidean_distance(p1, p2)
-    
-    start_point = coordinates[route[0]]
-    end_point = coordinates[route[-1]]
-    distance += euclidean_distance(end_point, start_point)
-    
-    return distance
+    # Sum every leg of the route, then close the loop back to the start
+    return distances[route[:-1], route[1:]].sum() + distances[route[-1], route[0]]
 
 def plot_route(coordinates, route, title, color='blue'):
-    """Visualizes the AUV route."""
+    """Visualizes the AUV route. 'coordinates' is an (N, 2) array and 'route' an array of sensor indices."""
     plt.figure(figsize=(8, 6))
-    x_coords = [p[0] for p in coordinates]
-    y_coords = [p[1] for p in coordinates]
-    plt.scatter(x_coords, y_coords, c='red', label='Sensors', zorder=2)
+    plt.scatter(coordinates[:, 0], coordinates[:, 1], c='red', label='Sensors', zorder=2)
     
-    route_x = [coordinates[i][0] for i in route]
-    route_y = [coordinates[i][1] for i in route]
-    plt.plot(route_x, route_y, c=color, linestyle='-', marker='o', label='AUV Route', zorder=1)
+    route_coords = coordinates[route]
+    plt.plot(route_coords[:, 0], route_coords[:, 1], c=color, linestyle='-', marker='o', label='AUV Route', zorder=1)
     
-    start_x, start_y = coordinates[route[0]]
-    end_x, end_y = coordinates[route[-1]]
-    plt.plot([end_x, start_x], [end_y, start_y], c=color, linestyle='--', zorder=1)
+    # Closing leg from the last sensor back to the start
+    closing_leg = route_coords[[-1, 0]]
+    plt.plot(closing_leg[:, 0], closing_leg[:, 1], c=color, linestyle='--', zorder=1)
     
     plt.title(title)
     plt.xlabel('X Coordinate')
@@ -51,119 +41,182 @@ def plot_route(coordinates, route, title, color='blue'):
     plt.show()
 
 # --- 2. Greedy Algorithm Implementation ---
-def greedy_route_optimizer(coordinates):
+def greedy_route_optimizer(distances):
     """
     Finds a route by always selecting the nearest unvisited sensor.
     """
-    num_sensors = len(coordinates)
+    num_sensors = len(distances)
     start_node = 0
     current_node = start_node
-    unvisited = list(range(1, num_sensors))
+    visited = np.zeros(num_sensors, dtype=bool)
+    visited[start_node] = True
     route = [start_node]
 
-    while unvisited:
-        nearest_node = None
-        min_distance = float('inf')
-        
-        for neighbor in unvisited:
-            dist = euclidean_distance(coordinates[current_node], coordinates[neighbor])
-            if dist < min_distance:
-                min_distance = dist
-                nearest_node = neighbor
+    for _ in range(num_sensors - 1):
+        # Mask out visited sensors so argmin picks the nearest unvisited one
+        dist = distances[current_node].copy()
+        dist[visited] = np.inf
+        nearest_node = int(dist.argmin())
         
         route.append(nearest_node)
-        unvisited.remove(nearest_node)
+        visited[nearest_node] = True
         current_node = nearest_node
         
     return route
 
 # --- 3. Genetic Algorithm Implementation ---
-def genetic_algorithm(coordinates, population_size=100, generations=500, mutation_rate=0.02):
+@njit(parallel=True, cache=True)
+def route_lengths(population, distances):
+    """Computes the total distance of every route (row) in the population."""
+    population_size, num_sensors = population.shape
+    lengths = np.empty(population_size)
+    for i in prange(population_size):
+        total = distances[population[i, num_sensors - 1], population[i, 0]]
+        for j in range(num_sensors - 1):
+            total += distances[population[i, j], population[i, j + 1]]
+        lengths[i] = total
+    return lengths
+
+@njit(cache=True)
+def ga_step(population, elite_idx, parent_idx, mutation_rate):
     """
-    Optimizes a route using a genetic algorithm.
+    Builds the next generation: copies the elites, then fills the remaining rows
+    with ordered-crossover children of the selected parent pairs, mutated by swapping.
     """
-    num_sensors = len(coordinates)
-    
-    def create_individual():
-        route = list(range(num_sensors))
-        random.shuffle(route)
-        return route
-
-    def create_population(size):
-        return [create_individual() for _ in range(size)]
-
-    def fitness(individual):
-        return 1 / calculate_total_distance(individual, coordinates)
-
-    def crossover(parent1, parent2):
-        start = random.randint(0, num_sensors - 1)
-        end = random.randint(start + 1, num_sensors)
-        child = [-1] * num_sensors
-        child[start:end] = parent1[start:end]
-        remaining = [item for item in parent2 if item not in child[start:end]]
-        
-        current_pos = 0
+    population_size, num_sensors = population.shape
+    elite_size = elite_idx.shape[0]
+    next_generation = np.empty_like(population)
+    for k in range(elite_size):
+        next_generation[k] = population[elite_idx[k]]
+
+    # Bitmask of the genes copied from parent1, reused for every child
+    in_slice = np.zeros(num_sensors, dtype=np.uint8)
+    for k in range(elite_size, population_size):
+        parent1 = population[parent_idx[k - elite_size, 0]]
+        parent2 = population[parent_idx[k - elite_size, 1]]
+        child = next_generation[k]
+
+        # Crossover: keep a slice of parent1, fill the rest in parent2's order
+        start = np.random.randint(0, num_sensors)
+        end = np.random.randint(start + 1, num_sensors + 1)
+        in_slice[:] = 0
+        for i in range(start, end):
+            child[i] = parent1[i]
+            in_slice[parent1[i]] = 1
+        pos = 0
         for i in range(num_sensors):
-            if child[i] == -1:
-                child[i] = remaining[current_pos]
-                current_pos += 1
-        return child
-
-    def mutate(individual, rate):
-        if random.random() < rate:
-            idx1, idx2 = random.sample(range(num_sensors), 2)
-            individual[idx1], individual[idx2] = individual[idx2], individual[idx1]
-        return individual
-
-    population = create_population(population_size)
+            gene = parent2[i]
+            if in_slice[gene] == 0:
+                if pos == start:
+                    pos = end
+                child[pos] = gene
+                pos += 1
+
+        # Mutation: swap two distinct positions
+        if np.random.random() < mutation_rate:
+            idx1 = np.random.randint(0, num_sensors)
+            idx2 = np.random.randint(0, num_sensors - 1)
+            if idx2 >= idx1:
+                idx2 += 1
+            child[idx1], child[idx2] = child[idx2], child[idx1]
+    return next_generation
+
+def genetic_algorithm(distances, population_size=100, generations=500, mutation_rate=0.02):
+    """
+    Optimizes a route using a genetic algorithm.
+    """
+    num_sensors = len(distances)
+    population = np.array([np.random.permutation(num_sensors) for _ in range(population_size)], dtype=np.int32)
+    elite_size = int(population_size * 0.1)
     
     for generation in range(generations):
-        fitnesses = [fitness(ind) for ind in population]
+        fitnesses = 1 / route_lengths(population, distances)
         
-        weighted_choices = random.choices(population, weights=fitnesses, k=population_size)
+        # Fitness-proportionate selection of every parent pair at once
+        cdf = np.cumsum(fitnesses)
+        cdf /= cdf[-1]
+        parent_idx = np.searchsorted(cdf, np.random.random((population_size - elite_size, 2)), side='right')
+        # Elites are the fittest routes; their relative order does not matter
+        elite_idx = np.argpartition(-fitnesses, elite_size - 1)[:elite_size]
         
-        next_generation = []
-        elite_size = int(population_size * 0.1)
-        next_generation.extend(sorted(population, key=fitness, reverse=True)[:elite_size])
+        population = ga_step(population, elite_idx, parent_idx, mutation_rate)
         
-        while len(next_generation) < population_size:
-            parent1, parent2 = random.choices(weighted_choices, k=2)
-            child = crossover(parent1, parent2)
-            child = mutate(child, mutation_rate)
-            next_generation.append(child)
-            
-        population = next_generation
-        
-    best_individual = max(population, key=fitness)
+    best_individual = population[np.argmin(route_lengths(population, distances))]
     return best_individual
 
+# --- 4. 2-opt Local Search ---
+@njit(parallel=True, cache=True)
+def best_two_opt_moves(route, distances):
+    """
+    For each start position i, finds the end position j whose segment reversal most shortens the route.
+    Returns the per-i best length change (0 if none improves) and the matching j.
+    """
+    num_sensors = route.shape[0]
+    best_delta = np.zeros(num_sensors)
+    best_j = np.zeros(num_sensors, dtype=np.int64)
+    for i in prange(1, num_sensors - 1):
+        a = route[i - 1]
+        b = route[i]
+        for j in range(i + 1, num_sensors):
+            c = route[j]
+            d = route[(j + 1) % num_sensors]
+            # Replace edges (a, b) and (c, d) with (a, c) and (b, d)
+            delta = distances[a, c] + distances[b, d] - distances[a, b] - distances[c, d]
+            if delta < best_delta[i]:
+                best_delta[i] = delta
+                best_j[i] = j
+    return best_delta, best_j
+
+def two_opt(route, distances):
+    """
+    Improves a route by repeatedly reversing the segment that shortens it the most,
+    until no reversal gives an improvement.
+    """
+    route = np.array(route, dtype=np.int32)
+    while True:
+        best_delta, best_j = best_two_opt_moves(route, distances)
+        i = int(np.argmin(best_delta))
+        if best_delta[i] >= -1e-9:
+            return route
+        j = best_j[i]
+        route[i:j + 1] = route[i:j + 1][::-1]
+
 # --- Main Execution Block ---
 if __name__ == "__main__":
     NUM_SENSORS = 20
     
     # Generate sensor coordinates
     sensor_coordinates = generate_sensor_coordinates(NUM_SENSORS)
+    sensor_distances = distance_matrix(sensor_coordinates)
     
     # --- 1. Random Path ---
-    random_route = list(range(NUM_SENSORS))
-    random.shuffle(random_route)
-    random_distance = calculate_total_distance(random_route, sensor_coordinates)
+    random_route = np.random.permutation(NUM_SENSORS)
+    random_distance = calculate_total_distance(random_route, sensor_distances)
     print(f"Random Path Distance: {random_distance:.2f}")
     plot_route(sensor_coordinates, random_route, f"Random Path (Distance: {random_distance:.2f})")
 
     # --- 2. Greedy Approach ---
-    greedy_route = greedy_route_optimizer(sensor_coordinates)
-    greedy_distance = calculate_total_distance(greedy_route, sensor_coordinates)
+    greedy_route = greedy_route_optimizer(sensor_distances)
+    greedy_distance = calculate_total_distance(greedy_route, sensor_distances)
     print(f"Greedy Path Distance: {greedy_distance:.2f}")
     plot_route(sensor_coordinates, greedy_route, f"Greedy Algorithm Path (Distance: {greedy_distance:.2f})", 'green')
     
     # --- 3. Genetic Algorithm ---
-    ga_optimized_route = genetic_algorithm(sensor_coordinates, generations=1000)
-    ga_distance = calculate_total_distance(ga_optimized_route, sensor_coordinates)
+    ga_optimized_route = genetic_algorithm(sensor_distances, generations=1000)
+    ga_distance = calculate_total_distance(ga_optimized_route, sensor_distances)
     print(f"Genetic Algorithm Path Distance: {ga_distance:.2f}")
     plot_route(sensor_coordinates, ga_optimized_route, f"Genetic Algorithm Optimized Path (Distance: {ga_distance:.2f})", 'purple')
 
+    # --- 4. GA + 2-opt Refinement ---
+    refined_route = two_opt(ga_optimized_route, sensor_distances)
+    refined_distance = calculate_total_distance(refined_route, sensor_distances)
+    print(f"GA + 2-opt Path Distance: {refined_distance:.2f}")
+    plot_route(sensor_coordinates, refined_route, f"GA + 2-opt Refined Path (Distance: {refined_distance:.2f})", 'orange')
+
     # --- Comparison ---
     print("\n--- Route Optimization Summary ---")
     print(f"Random Path Improvement: {((random_distance - ga_distance) / random_distance) * 100:.2f}%")
-    print(f"Greedy Path Improvement: {((greedy_distance - ga_distance) / greedy_distance) * 100:.2f}%")
\ No newline at end of file
+    print(f"Greedy Path Improvement: {((greedy_distance - ga_distance) / greedy_distance) * 100:.2f}%")
+    print(f"Random -> GA+2-opt Improvement: {((random_distance - refined_distance) / random_distance) * 100:.2f}%")
+    print(f"Greedy -> GA+2-opt Improvement: {((greedy_distance - refined_distance) / greedy_distance) * 100:.2f}%")
+    print(f"2-opt Improvement over GA: {((ga_distance - refined_distance) / ga_distance) * 100:.2f}%")
\ No newline at end of file
@@ -1,14 +1,17 @@
 import random
 import time
 import heapq
+import numpy as np
+from numba import njit
 
 class Stock:
     """Represents a stock with its daily price data and percentage change."""
-    def __init__(self, symbol, open_price, close_price):
+    __slots__ = ('symbol', 'open_price', 'close_price', 'change')
+    def __init__(self, symbol, open_price, close_price, change=None):
         self.symbol = symbol
         self.open_price = open_price
         self.close_price = close_price
-        self.change = self.calculate_percentage_change()
+        self.change = self.calculate_percentage_change() if change is None else change
 
     def calculate_percentage_change(self):
         """Calculates the percentage change from open to close price."""
@@ -20,65 +23,108 @@ class Stock:
         return f"Stock(Symbol='{self.symbol}', Change={self.change:.2f}%)"
 
 def generate_stock_data(num_stocks):
-    """Simulates a list of stock data for a given number of stocks."""
-    stocks = []
-    for i in range(num_stocks):
-        symbol = f"SYM{i:04d}"
-        open_price = round(random.uniform(10, 500), 2)
-        change_factor = random.uniform(0.95, 1.05)
-        close_price = round(open_price * change_factor, 2)
-        stocks.append(Stock(symbol, open_price, close_price))
-    return stocks
+    """
+    Simulates stock data for a given number of stocks as parallel arrays:
+    symbols, open prices, close prices and percentage changes.
+    """
+    rng = np.random.default_rng()
+    symbols = np.array([f"SYM{i:04d}" for i in range(num_stocks)], dtype=object)
+    open_prices = np.round(rng.uniform(10, 500, num_stocks), 2)
+    close_prices = np.round(open_prices * rng.uniform(0.95, 1.05, num_stocks), 2)
+    # Open prices are at least 10, so the zero-price case of Stock never applies here
+    changes = (close_prices - open_prices) / open_prices * 100
+    return symbols, open_prices, close_prices, changes
+
+def get_stock(stock_data, i):
+    """Creates a Stock object for row 'i' of the stock arrays."""
+    symbols, open_prices, close_prices, changes = stock_data
+    return Stock(symbols[i], float(open_prices[i]), float(close_prices[i]), float(changes[i]))
 
 # --- 1. Heap Sort Implementation ---
-def heap_sort(stocks):
-    """Sorts a list of stocks by percentage change using Heap Sort (max-heap)."""
-    n = len(stocks)
-
-    # Build a max-heap (rearranging the list)
-    # The heap is built on the 'change' attribute
+def heap_sort(changes):
+    """Returns the stock indices sorted by percentage change (descending) using Heap Sort (max-heap)."""
+    order = heap_sort_idx(changes)
+    # The order is ascending. Reverse it for descending.
+    return order[::-1]
+
+@njit(cache=True)
+def heap_sort_idx(keys):
+    """Returns the indices that sort 'keys' in ascending order, using an index max-heap."""
+    n = keys.shape[0]
+    idx = np.arange(n)
+
+    # Build a max-heap over the indices, keyed by 'keys'
     for i in range(n // 2 - 1, -1, -1):
-        heapify(stocks, n, i)
+        heapify(idx, keys, n, i)
 
     # One by one extract elements from the heap
     for i in range(n - 1, 0, -1):
-        stocks[i], stocks[0] = stocks[0], stocks[i]  # Move current root to end
-        heapify(stocks, i, 0) # Call max heapify on the reduced heap
-    
-    # The list is now sorted in ascending order. Reverse it for descending.
-    return stocks[::-1]
-
-def heapify(arr, n, i):
-    """Helper function for Heap Sort to maintain the heap property."""
-    largest = i
-    left = 2 * i + 1
-    right = 2 * i + 2
-
-    # Check if left child exists and is greater than root
-    if left < n and arr[left].change > arr[largest].change:
-        largest = left
-
-    # Check if right child exists and is greater than largest so far
-    if right < n and arr[right].change > arr[largest].change:
-        largest = right
-
-    # If the largest element is not the root, swap and heapify the sub-tree
-    if largest != i:
-        arr[i], arr[largest] = arr[largest], arr[i]
-        heapify(arr, n, largest)
+        idx[i], idx[0] = idx[0], idx[i]  # Move current root to end
+        heapify(idx, keys, i, 0) # Call max heapify on the reduced heap
+    return idx
+
+@njit(cache=True)
+def heapify(idx, keys, n, i):
+    """Helper function for Heap Sort to sift 'i' down and maintain the heap property."""
+    while True:
+        largest = i
+        left = 2 * i + 1
+        right = 2 * i + 2
+
+        # Check if left child exists and is greater than root
+        if left < n and keys[idx[left]] > keys[idx[largest]]:
+            largest = left
+
+        # Check if right child exists and is greater than largest so far
+        if right < n and keys[idx[right]] > keys[idx[largest]]:
+            largest = right
+
+        # If the largest element is the root, the sub-tree is already a heap
+        if largest == i:
+            return
+        idx[i], idx[largest] = idx[largest], idx[i]
+        i = largest
+
+# --- Top/Bottom K Stocks Functions ---
+# Only K rows are needed, so a bounded heap (O(n log k)) replaces a full sort.
+def get_top_stocks(stock_data, k=10):
+    """Returns the k stocks with the highest percentage change (biggest gainers)."""
+    changes = stock_data[3].tolist()
+    top_idx = heapq.nlargest(k, range(len(changes)), key=changes.__getitem__)
+    return [get_stock(stock_data, i) for i in top_idx]
+
+def get_bottom_stocks(stock_data, k=10):
+    """Returns the k stocks with the lowest percentage change (biggest losers)."""
+    changes = stock_data[3].tolist()
+    bottom_idx = heapq.nsmallest(k, range(len(changes)), key=changes.__getitem__)
+    return [get_stock(stock_data, i) for i in bottom_idx]
 
 # --- 2. Hash Map Implementation ---
-def build_stock_hash_map(stocks):
-    """Creates a hash map for O(1) lookups by stock symbol."""
+def build_stock_hash_map(symbols):
+    """Creates a hash map for O(1) lookups of a stock's row index by symbol."""
     stock_map = {}
-    for stock in stocks:
-        stock_map[stock.symbol] = stock
+    for i, symbol in enumerate(symbols):
+        stock_map[symbol] = i
     return stock_map
 
 def search_stock_by_symbol(stock_map, symbol):
-    """Retrieves a stock object from the hash map."""
+    """Retrieves a stock's row index from the hash map."""
     return stock_map.get(symbol)
 
+def search_stock_by_id(num_stocks, symbol):
+    """
+    Retrieves a stock's row index directly from its symbol, without hashing.
+    generate_stock_data() gives row 'i' the symbol f"SYM{i:04d}", so the numeric suffix is the index.
+    """
+    suffix = symbol[3:]
+    if not symbol.startswith("SYM") or not suffix.isascii() or not suffix.isdecimal():
+        return None
+    stock_id = int(suffix)
+    # Reject spellings of the ID that are not the real symbol, e.g. 'SYM1' or 'SYM00001'
+    if stock_id >= num_stocks or f"SYM{stock_id:04d}" != symbol:
+        return None
+    return stock_id
+
 # --- Main Program Execution and Comparison ---
 if __name__ == "__main__":
     NUM_STOCKS = 50000
@@ -91,20 +137,26 @@ if __name__ == "__main__":
     print("\n--- Sorting Performance ---")
     
     # Custom Heap Sort
-    heap_sort_data = list(stock_data)
+    symbols, open_prices, close_prices, changes = stock_data
+    heap_sort_idx(np.zeros(1)) # Compile the Numba kernel before timing
     start_time_heap = time.perf_counter()
-    heap_sorted_stocks = heap_sort(heap_sort_data)
+    heap_sorted_idx = heap_sort(changes)
     end_time_heap = time.perf_counter()
     print(f"Heap Sort took: {end_time_heap - start_time_heap:.6f} seconds")
 
     # Standard Library Sort (Timsort)
     start_time_lib = time.perf_counter()
-    lib_sorted_stocks = sorted(stock_data, key=lambda s: s.change, reverse=True)
+    change_list = changes.tolist()
+    lib_sorted_idx = sorted(range(NUM_STOCKS), key=change_list.__getitem__, reverse=True)
     end_time_lib = time.perf_counter()
     print(f"Python's sorted() took: {end_time_lib - start_time_lib:.6f} seconds")
 
-    print("\n--- Top 10 Stocks by Performance (using sorted list) ---")
-    for i, stock in enumerate(lib_sorted_stocks[:10]):
+    print("\n--- Top 10 Stocks by Performance (using heapq.nlargest) ---")
+    for i, stock in enumerate(get_top_stocks(stock_data)):
+        print(f"{i+1}. {stock}")
+
+    print("\n--- Bottom 10 Stocks by Performance (using heapq.nsmallest) ---")
+    for i, stock in enumerate(get_bottom_stocks(stock_data)):
         print(f"{i+1}. {stock}")
 
     # --- Searching Performance Comparison ---
@@ -112,30 +164,39 @@ if __name__ == "__main__":
     
     # Build the hash map
     start_time_build = time.perf_counter()
-    stock_map = build_stock_hash_map(stock_data)
+    stock_map = build_stock_hash_map(symbols)
     end_time_build = time.perf_counter()
     print(f"Hash Map build time: {end_time_build - start_time_build:.6f} seconds")
 
     # Test lookup for a specific symbol
-    search_symbol = stock_data[random.randint(0, NUM_STOCKS - 1)].symbol
+    search_symbol = symbols[random.randint(0, NUM_STOCKS - 1)]
     start_time_search = time.perf_counter()
-    found_stock = search_stock_by_symbol(stock_map, search_symbol)
+    found_index = search_stock_by_symbol(stock_map, search_symbol)
     end_time_search = time.perf_counter()
     print(f"Hash Map lookup for '{search_symbol}' took: {end_time_search - start_time_search:.9f} seconds")
-    if found_stock:
-        print(f"  Found Stock: {found_stock}")
+    if found_index is not None:
+        print(f"  Found Stock: {get_stock(stock_data, found_index)}")
     
     # Standard dictionary lookup for comparison
     start_time_dict = time.perf_counter()
     dict_found = stock_map.get(search_symbol)
     end_time_dict = time.perf_counter()
     print(f"Standard dict lookup took: {end_time_dict - start_time_dict:.9f} seconds")
+
+    # Direct lookup by the symbol's numeric ID, no hash map required
+    start_time_id = time.perf_counter()
+    id_found = search_stock_by_id(NUM_STOCKS, search_symbol)
+    end_time_id = time.perf_counter()
+    print(f"Symbol ID lookup took: {end_time_id - start_time_id:.9f} seconds")
+    print(f"  Matches hash map result: {id_found == found_index}")
     
     # --- Analysis ---
     print("\n--- Analysis of Trade-offs ---")
     print("Sorting:")
-    print("  Timsort (Python's built-in sorted()) is highly optimized and often outperforms a pure Heap Sort for typical datasets.")
-    print("  Heap Sort has a guaranteed O(n log n) worst-case time complexity, making it a reliable choice for any data distribution.")
+    print("  The Heap Sort here is JIT-compiled with Numba and sorts a contiguous float64 array of changes, so it runs at")
+    print("  native speed and can match or beat Timsort (Python's built-in sorted()), which compares boxed Python floats.")
+    print("  Heap Sort has a guaranteed O(n log n) worst-case time complexity, making it a reliable choice for any data distribution;")
+    print("  Timsort is stable and adapts to partially ordered input, while Heap Sort is not stable.")
     print("Searching:")
     print("  Hash Maps (dictionaries) provide constant time (O(1)) average-case lookups, which is crucial for real-time systems where speed is critical.")
     print("  The trade-off is the initial time and memory required to build the hash map, but this cost is quickly recouped by the speed of subsequent searches.")